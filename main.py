@@ -7,7 +7,6 @@ A cross-platform video downloader powered by FFMPEG.
 import logging
 import sys
 import os
-from quik_downloader.ui.menu import MenuInterface
 from quik_downloader.utils.colors import *
 
 def setup_logging():
@@ -45,7 +44,8 @@ def main():
         logger = logging.getLogger('QUIK_Downloader')
         logger.info("Application starting")
         
-        # Create and run menu interface
+        # Create and run menu interface (imported only once the version check passed)
+        from quik_downloader.ui.menu import MenuInterface
         menu = MenuInterface()
         menu.run()
         
@@ -1,30 +1,84 @@
 # Video downloader core module for QUIK Downloader
+import asyncio
+import json
 import subprocess
 import time
 import logging
 import os
-from typing import List, Optional
+import sys
+from typing import AsyncIterator, Dict, List, NamedTuple, Optional, Set, Tuple
 from urllib.parse import urlparse
 from quik_downloader.utils.colors import *
-from quik_downloader.ui.output_framer import print_header, print_content_line, print_footer, print_progress_line
+from quik_downloader.ui.output_framer import (open_frame, print_footer, print_download_line,
+                                              print_status, update_progress, end_progress,
+                                              render_progress_bar)
 
 # Get logger for this module
 logger = logging.getLogger('QUIK_Downloader.downloader')
 
+# Python 3.7 on Windows defaults to the selector event loop, which cannot
+# spawn subprocesses; 3.8+ already uses the proactor loop there
+if os.name == 'nt' and sys.version_info < (3, 8):
+    asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+
+# FFMPEG pipes are drained in blocks of this size rather than line by line
+_READ_BLOCK_SIZE = 65536
+
+# -progress keys used for rendering; everything else is dropped undecoded
+_PROGRESS_KEYS = frozenset({b'out_time', b'out_time_us', b'out_time_ms',
+                            b'total_size', b'speed', b'progress'})
+
+# Hardware H.264 encoders in order of preference, with their encoder options.
+# h264_vaapi is left out because it needs a device and an hwupload filter.
+_HW_ENCODERS: Tuple[Tuple[str, List[str]], ...] = (
+    ('h264_nvenc', ['-preset', 'p4']),
+    ('h264_qsv', []),
+    ('h264_videotoolbox', []),
+)
+
+# Target height of every re-encoding quality
+_QUALITY_HEIGHTS = {'high': 720, 'medium': 480, 'low': 360}
+
+# Containers that take H.264 + AAC as a plain stream copy
+_COPY_FRIENDLY_FORMATS = frozenset({'mp4', 'mkv', 'mov'})
+
+class StreamInfo(NamedTuple):
+    """Stream metadata from ffprobe; fields are None when unknown."""
+    duration: Optional[float]
+    video_codec: Optional[str]
+    audio_codec: Optional[str]
+    height: Optional[int]
+
+_UNKNOWN_STREAM = StreamInfo(None, None, None, None)
+
 class VideoDownloader:
     """Handles M3U8 video downloading operations using FFMPEG."""
     
+    # Usable hardware encoder per FFMPEG executable (None = software only)
+    _hwenc_cache: Dict[str, Optional[str]] = {}
+    # FFMPEG executables that already passed check_dependencies()
+    _dep_cache: Dict[str, bool] = {}
+    
     def __init__(self, video_quality: str = 'best', output_format: str = 'mp4', 
                  ffmpeg_path: Optional[str] = None):
         """Initialize VideoDownloader with quality and format settings."""
         self.video_quality = video_quality
         self.output_format = output_format  
         self.ffmpeg_path = ffmpeg_path or 'ffmpeg'
+        # Output paths handed out to downloads of this session, so that
+        # concurrent downloads never write to the same file
+        self._claimed_paths: Set[str] = set()
+        # ffprobe results keyed by URL
+        self._stream_cache: Dict[str, StreamInfo] = {}
+        # Only re-encoding qualities need an encoder, copy mode skips the probe
+        self.hw_encoder = self._detect_hwenc() if video_quality != 'best' else None
         logger.info(f"VideoDownloader initialized: quality={video_quality}, format={output_format}")
         
     def set_quality(self, quality: str):
         """Update video quality setting."""
         self.video_quality = quality
+        if quality != 'best':
+            self.hw_encoder = self._detect_hwenc()
         logger.info(f"Quality updated to: {quality}")
         
     def set_format(self, output_format: str):
@@ -32,89 +86,298 @@ class VideoDownloader:
         self.output_format = output_format
         logger.info(f"Format updated to: {output_format}")
         
-    def download_video(self, url: str, output_dir: str) -> bool:
-        """Download a single video with configured settings."""
-        if not url.strip() or not url.lower().startswith(('http://', 'https://')):
-            error(f"Invalid or empty URL skipped: {url[:50]}...")
+    async def download_video(self, url: str, output_dir: str, label: Optional[str] = None) -> bool:
+        """Download a single video with configured settings.
+        
+        label (e.g. "[2/5]") identifies the download on the shared progress
+        row and in its messages while several downloads run at once.
+        """
+        # Only the scheme needs a case-insensitive look, not the whole URL
+        url = url.strip()
+        if not url or not url[:8].lower().startswith(('http://', 'https://')):
+            print_status('error', f"Invalid or empty URL skipped: {url[:50]}...")
             return False
             
         try:
             # Generate output filename
             output_path = self._generate_output_filename(url, output_dir)
+            name = os.path.basename(output_path)
+            tag = f"{label} " if label else ''
             
             # Show simple start message
-            print_progress("Starting download...")
+            print_status('progress', f"{tag}Starting download: {name}")
+            
+            # Total duration lets the progress row show a real percentage,
+            # the codecs tell whether re-encoding would change anything
+            stream = await self.probe_streams(url)
+            copy = self.video_quality != 'best' and self._is_copy_compatible(stream)
+            if copy:
+                print_status('info', f"{tag}Source is already H.264/AAC at {stream.height}p, "
+                                     f"copying instead of re-encoding")
             
             # Build FFMPEG command based on quality setting
-            cmd = self._build_ffmpeg_command(url, output_path)
+            cmd = self._build_ffmpeg_command(url, output_path, copy=copy)
+            used_hwenc = self.hw_encoder is not None and not copy and self.video_quality in _QUALITY_HEIGHTS
             
             # Execute download, showing FFMPEG's native output
-            if self._execute_ffmpeg_command(cmd, os.path.basename(output_path)):
+            succeeded = await self._execute_ffmpeg_command(cmd, name, stream.duration, label)
+            
+            # A hardware encoder that passed the test encode can still fail on
+            # real input (10-bit sources, session limits); libx264 gets a try
+            # at the requested resolution before falling back to a copy
+            if not succeeded and used_hwenc:
+                self._disable_hwenc()
+                print_status('warning', f"{tag}Hardware encoding of {name} failed. Retrying with libx264...")
+                cmd = self._build_ffmpeg_command(url, output_path, copy=copy)
+                succeeded = await self._execute_ffmpeg_command(cmd, name, stream.duration, label)
+            
+            if succeeded:
                 # Verify file was created and has content
-                if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
-                    file_size = os.path.getsize(output_path) / (1024 * 1024)  # MB
-                    success(f"Download complete. File size: {file_size:.1f}MB")
+                file_size = self._output_size(output_path)
+                if file_size > 0:
+                    file_size /= (1024 * 1024)  # MB
+                    print_status('success', f"{tag}Download complete: {name} ({file_size:.1f}MB)")
                     logger.info(f"Successfully downloaded: {url}")
                     return True
                 else:
-                    error("Download finished, but the output file is empty.")
+                    print_status('error', f"{tag}Download finished, but {name} is empty.")
                     return False
             else:
                 # For re-encoding failures, try fallback to copy mode
-                if self.video_quality != 'best':
-                    warning("Re-encoding failed. Attempting a direct copy as a fallback...")
-                    return self._try_fallback_download(url, output_path)
+                if self.video_quality != 'best' and not copy:
+                    print_status('warning', f"{tag}Re-encoding {name} failed. "
+                                            f"Attempting a direct copy as a fallback...")
+                    return await self._try_fallback_download(url, output_path, stream.duration, label)
                 else:
-                    error("Download failed. Check FFMPEG output above for details.")
+                    print_status('error', f"{tag}Download of {name} failed. "
+                                          f"Check FFMPEG output above for details.")
                     return False
                     
         except subprocess.TimeoutExpired:
-            error("FFMPEG process timed out (1 hour limit).")
+            print_status('error', "FFMPEG process timed out (1 hour limit).")
             return False
+        except asyncio.CancelledError:
+            # An Exception subclass on 3.7; cancellation must not count as a failure
+            raise
         except Exception as e:
-            error(f"An unexpected error occurred during download: {e}")
+            print_status('error', f"An unexpected error occurred during download: {e}")
             logger.error(f"Exception downloading {url}: {e}")
             return False
     
-    def _execute_ffmpeg_command(self, cmd: List[str], title: str) -> bool:
-        """Executes the FFMPEG command and shows its output in a styled frame."""
+    def _output_size(self, output_path: str) -> int:
+        """Returns the size of a downloaded file in bytes (0 if it doesn't exist)."""
+        try:
+            return os.stat(output_path).st_size
+        except FileNotFoundError:
+            return 0
+    
+    async def _execute_ffmpeg_command(self, cmd: List[str], title: str,
+                                      duration: Optional[float] = None,
+                                      label: Optional[str] = None) -> bool:
+        """Executes the FFMPEG command and shows its output in a styled frame.
+        
+        Inside an already open frame (a batch of downloads) no frame of its
+        own is drawn.
+        """
         try:
-            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, 
-                                       text=True, encoding='utf-8', errors='replace')
-            
-            print_header(title)
-            
-            # Read and print output line by line
-            if process.stdout:
-                for line in iter(process.stdout.readline, ''):
-                    # FFMPEG stats updates often use carriage return
-                    if '\r' in line or line.lstrip().startswith(('frame=', 'size=')):
-                        print_progress_line(line)
-                    else:
-                        print_content_line(line)
-                process.stdout.close()
-            
-            # After progress line, move to next line before footer
-            print() 
+            process = await asyncio.create_subprocess_exec(
+                *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+            
+            own_frame = open_frame(title)
+            
+            # Progress arrives as key=value pairs on stdout, errors on stderr.
+            # In a shared frame both are tagged with the download's label.
+            label = title if own_frame else (label or title)
+            await asyncio.gather(self._read_progress(process.stdout, title, duration, label),
+                                 self._read_log(process.stderr, label))
+            end_progress(title)
 
             # Wait for the process to finish
-            return_code = process.wait()
+            return_code = await process.wait()
             
-            print_footer()
+            if own_frame:
+                print_footer()
             
             return return_code == 0
             
         except FileNotFoundError:
-            error(f"FFMPEG command not found. Please check your installation and PATH.")
+            print_status('error', "FFMPEG command not found. Please check your installation and PATH.")
             logger.error(f"FFMPEG not found when trying to execute command: {' '.join(cmd)}")
             return False
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            error(f"Failed to execute FFMPEG command: {e}")
+            print_status('error', f"Failed to execute FFMPEG command: {e}")
             logger.error(f"Error executing FFMPEG command: {e}")
             return False
     
+    async def _read_progress(self, stream: asyncio.StreamReader, title: str,
+                             duration: Optional[float] = None, label: Optional[str] = None):
+        """Parses FFMPEG's -progress output and redraws the progress row per update."""
+        label = label or title
+        # The full line needs no tag while the download has the frame to itself
+        prefix = '' if label == title else f"{label} "
+        stats: Dict[bytes, bytes] = {}
+        async for lines in self._iter_line_blocks(stream):
+            block_done = False
+            for raw in lines:
+                key, sep, value = raw.partition(b'=')
+                if not sep or key not in _PROGRESS_KEYS:
+                    continue
+                stats[key] = value.strip()
+                # Every progress block ends with progress=continue or progress=end
+                if key == b'progress':
+                    block_done = True
+            # Several progress blocks may arrive in one read; draw only the newest
+            if block_done:
+                fraction = self._progress_fraction(stats, duration)
+                if fraction is not None:
+                    summary = f"{label} {fraction * 100:.0f}%"
+                else:
+                    summary = f"{label} {self._format_out_time(stats)}"
+                update_progress(title, prefix + self._format_progress(stats, duration, fraction), summary)
+    
+    async def _read_log(self, stream: asyncio.StreamReader, title: str):
+        """Prints FFMPEG log messages inside the frame, tagged with title when it's shared."""
+        async for lines in self._iter_line_blocks(stream):
+            for raw in lines:
+                if raw.strip():
+                    print_download_line(title, raw.decode('utf-8', errors='replace'))
+    
+    async def _iter_line_blocks(self, stream: asyncio.StreamReader) -> AsyncIterator[List[bytes]]:
+        """Reads a stream in large blocks and yields the complete lines of each block."""
+        buffer = bytearray()
+        while True:
+            chunk = await stream.read(_READ_BLOCK_SIZE)
+            if not chunk:
+                break
+            buffer += chunk
+            end = buffer.rfind(b'\n')
+            if end < 0:
+                continue
+            lines = bytes(buffer[:end]).split(b'\n')
+            del buffer[:end + 1]
+            yield lines
+        if buffer:
+            yield [bytes(buffer)]
+    
+    def _progress_fraction(self, stats: Dict[bytes, bytes],
+                           duration: Optional[float] = None) -> Optional[float]:
+        """Returns the completed fraction of a parsed -progress block (None if unknown)."""
+        if not duration:
+            return None
+        if stats.get(b'progress') == b'end':
+            return 1.0
+        # out_time_ms is in microseconds as well, despite its name
+        elapsed = stats.get(b'out_time_us') or stats.get(b'out_time_ms') or b'0'
+        try:
+            return min(max(int(elapsed) / (duration * 1_000_000), 0.0), 1.0)
+        except ValueError:
+            return None
+    
+    def _format_out_time(self, stats: Dict[bytes, bytes]) -> str:
+        """Returns the output position of a parsed -progress block as HH:MM:SS."""
+        return stats.get(b'out_time', b'').split(b'.')[0].decode('ascii', errors='replace') or '--:--:--'
+    
+    def _format_progress(self, stats: Dict[bytes, bytes], duration: Optional[float] = None,
+                         fraction: Optional[float] = None) -> str:
+        """Formats a parsed -progress block as a short status line."""
+        try:
+            size = f"{int(stats.get(b'total_size', b'0')) / (1024 * 1024):.1f}MB"
+        except ValueError:
+            size = '?MB'
+        speed = stats.get(b'speed', b'N/A').decode('ascii', errors='replace')
+        status = f"{self._format_out_time(stats)} | {size} | {speed}"
+        
+        if fraction is None:
+            fraction = self._progress_fraction(stats, duration)
+        if fraction is not None:
+            status = f"{render_progress_bar(fraction)} {fraction * 100:5.1f}% | {status}"
+        
+        return status
+    
+    def _get_ffprobe_path(self) -> str:
+        """Returns the ffprobe executable that ships next to the configured FFMPEG."""
+        directory, name = os.path.split(self.ffmpeg_path)
+        if 'ffmpeg' not in name:
+            return 'ffprobe'
+        return os.path.join(directory, name.replace('ffmpeg', 'ffprobe'))
+    
+    async def probe_streams(self, url: str) -> StreamInfo:
+        """Returns duration, codecs and video height using ffprobe, cached per URL."""
+        if url in self._stream_cache:
+            return self._stream_cache[url]
+        
+        stream = _UNKNOWN_STREAM
+        try:
+            process = await asyncio.create_subprocess_exec(
+                self._get_ffprobe_path(), '-v', 'error',
+                '-show_entries', 'format=duration:stream=codec_type,codec_name,height',
+                '-of', 'json', url,
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL)
+            try:
+                stdout, _ = await asyncio.wait_for(process.communicate(), timeout=30)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                logger.warning(f"ffprobe timed out for {url}")
+            else:
+                stream = self._parse_probe_output(stdout)
+        except FileNotFoundError:
+            logger.warning("ffprobe not found, progress will be shown without percentage")
+        except ValueError as e:
+            logger.warning(f"Unreadable ffprobe output for {url}: {e}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"ffprobe failed for {url}: {e}")
+        
+        self._stream_cache[url] = stream
+        return stream
+    
+    def _parse_probe_output(self, output: bytes) -> StreamInfo:
+        """Extracts a StreamInfo from ffprobe's JSON output."""
+        data = json.loads(output or b'{}')
+        
+        try:
+            duration: Optional[float] = float(data.get('format', {}).get('duration', 0))
+        except (TypeError, ValueError):
+            # Live streams and unknown lengths report N/A
+            duration = None
+        if not duration or duration <= 0:
+            duration = None
+        
+        streams = data.get('streams', [])
+        videos = [s for s in streams if s.get('codec_type') == 'video']
+        audios = [s for s in streams if s.get('codec_type') == 'audio']
+        
+        # FFMPEG maps the highest resolution video stream by default
+        video = max(videos, key=lambda s: s.get('height') or 0, default=None)
+        audio_codecs = {s.get('codec_name') for s in audios}
+        
+        return StreamInfo(
+            duration=duration,
+            video_codec=video.get('codec_name') if video else None,
+            audio_codec=audio_codecs.pop() if len(audio_codecs) == 1 else None,
+            height=video.get('height') if video else None,
+        )
+    
+    def _is_copy_compatible(self, stream: StreamInfo) -> bool:
+        """True when re-encoding would not shrink or convert the source at all.
+        
+        That is an H.264/AAC source no taller than the target height, going
+        into a container that takes both as a stream copy.
+        """
+        target_height = _QUALITY_HEIGHTS.get(self.video_quality)
+        return (target_height is not None
+                and self.output_format in _COPY_FRIENDLY_FORMATS
+                and stream.video_codec == 'h264'
+                and stream.audio_codec == 'aac'
+                and stream.height is not None
+                and stream.height <= target_height)
+    
     def _generate_output_filename(self, url: str, output_dir: str) -> str:
-        """Generate output filename based on URL."""
+        """Generate a unique output filename based on URL."""
         try:
             # Extract domain name from URL
             parsed_url = urlparse(url)
@@ -124,30 +387,99 @@ class VideoDownloader:
             timestamp = int(time.time())
             
             # Format: domain_timestamp.format
-            filename = f"{domain}_{timestamp}.{self.output_format}"
-            return os.path.join(output_dir, filename)
+            base_name = f"{domain}_{timestamp}"
             
         except Exception:
             # Fallback: use generic timestamp
             timestamp = int(time.time())
-            filename = f"video_{timestamp}.{self.output_format}"
-            return os.path.join(output_dir, filename)
+            base_name = f"video_{timestamp}"
+        
+        # Downloads started in the same second share a timestamp,
+        # so add a counter until the name is free
+        output_path = os.path.join(output_dir, f"{base_name}.{self.output_format}")
+        counter = 1
+        while output_path in self._claimed_paths or os.path.exists(output_path):
+            output_path = os.path.join(output_dir, f"{base_name}_{counter}.{self.output_format}")
+            counter += 1
+        
+        self._claimed_paths.add(output_path)
+        return output_path
+    
+    def _detect_hwenc(self) -> Optional[str]:
+        """Returns the first hardware H.264 encoder FFMPEG can use, cached per executable.
+        
+        Builds often list encoders without matching hardware, so every
+        listed candidate is confirmed with a short test encode.
+        """
+        if self.ffmpeg_path in VideoDownloader._hwenc_cache:
+            return VideoDownloader._hwenc_cache[self.ffmpeg_path]
+        
+        encoder = None
+        try:
+            result = subprocess.run([self.ffmpeg_path, '-hide_banner', '-encoders'],
+                                    capture_output=True, text=True, timeout=10)
+            for name, _ in _HW_ENCODERS:
+                if name in result.stdout and self._test_encoder(name):
+                    encoder = name
+                    break
+        except (subprocess.TimeoutExpired, OSError) as e:
+            logger.warning(f"Hardware encoder detection failed: {e}")
+        
+        logger.info(f"Hardware encoder: {encoder or 'none (using libx264)'}")
+        VideoDownloader._hwenc_cache[self.ffmpeg_path] = encoder
+        return encoder
+    
+    def _disable_hwenc(self):
+        """Stops using the hardware encoder for the rest of the session after it failed."""
+        if self.hw_encoder is None:
+            return
+        logger.warning(f"Hardware encoder {self.hw_encoder} failed, using libx264 from now on")
+        self.hw_encoder = None
+        VideoDownloader._hwenc_cache[self.ffmpeg_path] = None
+    
+    def _test_encoder(self, encoder: str) -> bool:
+        """Encodes a fraction of a second of blank video to check an encoder works."""
+        try:
+            result = subprocess.run(
+                [self.ffmpeg_path, '-hide_banner', '-loglevel', 'error',
+                 '-f', 'lavfi', '-i', 'color=black:s=256x256:d=0.1',
+                 '-c:v', encoder, '-f', 'null', '-'],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=15)
+            return result.returncode == 0
+        except (subprocess.TimeoutExpired, OSError):
+            return False
+    
+    def _get_video_encoder_params(self) -> List[str]:
+        """Get FFMPEG video encoder parameters, preferring the hardware encoder."""
+        for name, options in _HW_ENCODERS:
+            if name == self.hw_encoder:
+                return ['-c:v', name, *options]
+        return ['-c:v', 'libx264']
     
     def _get_quality_params(self) -> List[str]:
         """Get FFMPEG parameters for selected quality."""
+        if self.video_quality not in _QUALITY_HEIGHTS:
+            return ['-c', 'copy']
+        
+        video_params = self._get_video_encoder_params()
         quality_map = {
-            'best': ['-c', 'copy'],
-            'high': ['-vf', 'scale=-2:720', '-c:v', 'libx264', '-c:a', 'aac'],
-            'medium': ['-vf', 'scale=-2:480', '-c:v', 'libx264', '-c:a', 'aac'],
-            'low': ['-vf', 'scale=-2:360', '-c:v', 'libx264', '-c:a', 'aac']
+            'high': ['-vf', 'scale=-2:720', *video_params, '-c:a', 'aac'],
+            'medium': ['-vf', 'scale=-2:480', *video_params, '-c:a', 'aac'],
+            'low': ['-vf', 'scale=-2:360', *video_params, '-c:a', 'aac']
         }
         
-        return quality_map.get(self.video_quality, quality_map['best'])
+        return quality_map[self.video_quality]
     
-    def _build_ffmpeg_command(self, url: str, output_path: str) -> List[str]:
-        """Build FFMPEG command for download."""
-        cmd = [
-            self.ffmpeg_path,
+    def _build_ffmpeg_command(self, url: str, output_path: str, copy: bool = False) -> List[str]:
+        """Build FFMPEG command for download (copy forces a direct stream copy)."""
+        cmd = [self.ffmpeg_path]
+        copy = copy or self.video_quality not in _QUALITY_HEIGHTS
+        
+        # Decode on the GPU too when re-encoding with a hardware encoder
+        if not copy and self.hw_encoder:
+            cmd.extend(['-hwaccel', 'auto'])
+        
+        cmd += [
             '-i', url,
             '-bsf:a', 'aac_adtstoasc',
             '-y'  # Overwrite output file
@@ -155,53 +487,59 @@ class VideoDownloader:
         
         # Add FFMPEG flags to reduce console verbosity for cleaner output
         # -loglevel error: Shows only errors
-        # -stats: Shows progress stats
-        cmd.extend(['-loglevel', 'error', '-stats'])
+        # -nostats -progress pipe:1: Machine-readable progress on stdout
+        cmd.extend(['-loglevel', 'error', '-nostats', '-progress', 'pipe:1'])
 
         # Add quality parameters
-        quality_params = self._get_quality_params()
+        quality_params = ['-c', 'copy'] if copy else self._get_quality_params()
         cmd.extend(quality_params)
         cmd.append(output_path)
         
         logger.debug(f"FFMPEG command: {' '.join(cmd)}")
         return cmd
     
-    def _try_fallback_download(self, url: str, output_path: str) -> bool:
+    async def _try_fallback_download(self, url: str, output_path: str,
+                                     duration: Optional[float] = None,
+                                     label: Optional[str] = None) -> bool:
         """Fallback to copy mode if re-encoding fails."""
+        name = os.path.basename(output_path)
+        tag = f"{label} " if label else ''
         try:
             # Build fallback command with copy mode
-            fallback_cmd = [
-                self.ffmpeg_path,
-                '-i', url,
-                '-c', 'copy',
-                '-bsf:a', 'aac_adtstoasc',
-                '-y',
-                output_path
-            ]
-            
-            if self._execute_ffmpeg_command(fallback_cmd, "Fallback Attempt"):
-                if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
-                    success("Fallback download method successful.")
+            fallback_cmd = self._build_ffmpeg_command(url, output_path, copy=True)
+            
+            title = f"Fallback Attempt: {name}"
+            if await self._execute_ffmpeg_command(fallback_cmd, title, duration, label):
+                if self._output_size(output_path) > 0:
+                    print_status('success', f"{tag}Fallback download of {name} successful.")
                     logger.info(f"Fallback download successful for: {url}")
                     return True
                 else:
-                    error("Fallback download finished, but the output file is empty.")
+                    print_status('error', f"{tag}Fallback download finished, but {name} is empty.")
                     return False
             else:
-                error("The alternative download method (direct copy) also failed.")
+                print_status('error', f"{tag}The direct copy of {name} also failed.")
                 return False
                 
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            error(f"An unexpected error occurred during fallback download: {e}")
+            print_status('error', f"An unexpected error occurred during fallback download: {e}")
             logger.error(f"Fallback exception for {url}: {e}")
             return False
     
     def check_dependencies(self) -> bool:
-        """Check if FFMPEG is available."""
+        """Check if FFMPEG is available (successful checks are cached per path)."""
+        if VideoDownloader._dep_cache.get(self.ffmpeg_path):
+            return True
+        
         try:
-            result = subprocess.run([self.ffmpeg_path, '-version'], 
-                                    capture_output=True, text=True, timeout=10)
+            # Only the exit code matters, so the banner is discarded unread
+            result = subprocess.run([self.ffmpeg_path, '-version'],
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
             if result.returncode == 0:
+                # Failures are not cached so FFMPEG can be fixed without a restart
+                VideoDownloader._dep_cache[self.ffmpeg_path] = True
                 return True
             else:
                 error("FFMPEG not working")
@@ -1,13 +1,23 @@
 # File handling operations for QUIK Downloader
 import os
+import re
 import configparser
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from quik_downloader.utils.colors import *
 
 # Get logger for this module
 logger = logging.getLogger('QUIK_Downloader.file_handler')
 
+# A stripped URLs.txt line holding a single http(s) URL. Comment and
+# blank lines never match, so this is the only filter needed.
+_URL_RE = re.compile(rb'^https?://\S+$', re.IGNORECASE)
+
+# Content of a freshly created URLs.txt
+_URLS_WELCOME = (b"# Welcome to QUIK Downloader!\n"
+                 b"# Add your M3U8 video links here, one per line.\n"
+                 b"# Lines starting with '#' are ignored.\n")
+
 class FileHandler:
     """Handles all file operations for the application."""
     
@@ -19,8 +29,12 @@ class FileHandler:
             'download_directory': './downloads',
             'video_quality': 'best',
             'output_format': 'mp4',
-            'ffmpeg_path': 'ffmpeg'
+            'ffmpeg_path': 'ffmpeg',
+            'max_concurrent_downloads': '3'
         }
+        # Last parsed settings and the (mtime, size) of the file they came from
+        self._settings_cache: Optional[Dict[str, Any]] = None
+        self._settings_stamp: Optional[Tuple[int, int]] = None
         logger.info("FileHandler initialized")
     
     def read_settings(self) -> Dict[str, Any]:
@@ -28,13 +42,25 @@ class FileHandler:
         Reads settings from settings.ini file.
         Creates file with defaults if it doesn't exist.
         
+        The parsed result is cached and reused while the file's
+        modification time and size stay the same.
+        
         Returns:
             Dict[str, Any]: Settings dictionary
         """
-        config = configparser.ConfigParser()
-        
         try:
-            if os.path.exists(self.settings_file):
+            try:
+                st = os.stat(self.settings_file)
+            except FileNotFoundError:
+                st = None
+            
+            if st is not None:
+                stamp = (st.st_mtime_ns, st.st_size)
+                if self._settings_cache is not None and stamp == self._settings_stamp:
+                    # Callers edit the dict in place, so hand out a copy
+                    return dict(self._settings_cache)
+                
+                config = configparser.ConfigParser()
                 config.read(self.settings_file)
                 
                 if 'SETTINGS' in config:
@@ -42,6 +68,8 @@ class FileHandler:
                     for key in self.default_settings:
                         settings[key] = config.get('SETTINGS', key, fallback=self.default_settings[key])
                     
+                    self._settings_cache = dict(settings)
+                    self._settings_stamp = stamp
                     logger.info("Settings loaded successfully")
                     return settings
                 else:
@@ -68,6 +96,8 @@ class FileHandler:
         """
         config = configparser.ConfigParser()
         config['SETTINGS'] = settings
+        # The file is about to change, the next read parses it again
+        self._settings_cache = None
         
         try:
             with open(self.settings_file, 'w') as f:
@@ -97,17 +127,23 @@ class FileHandler:
         """Read URLs from URLs.txt, creating the file if it doesn't exist."""
         urls = []
         try:
-            if not os.path.exists('URLs.txt'):
+            # Create the file only if it's missing, in one atomic open
+            try:
+                fd = os.open('URLs.txt', os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            except FileExistsError:
+                pass
+            else:
                 logger.info("'URLs.txt' not found, creating it with a welcome message.")
-                with open('URLs.txt', 'w', encoding='utf-8') as f:
-                    f.write("# Welcome to QUIK Downloader!\n")
-                    f.write("# Add your M3U8 video links here, one per line.\n")
-                    f.write("# Lines starting with '#' are ignored.\n")
+                try:
+                    os.write(fd, _URLS_WELCOME)
+                finally:
+                    os.close(fd)
                 return [] # Return empty list on first creation
 
-            with open('URLs.txt', 'r', encoding='utf-8') as f:
-                # Read non-empty lines that are not comments
-                urls = [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
+            with open('URLs.txt', 'rb') as f:
+                # Keep http(s) URL lines; each line is stripped exactly once
+                stripped = (line.strip() for line in f)
+                urls = [s.decode('utf-8', errors='replace') for s in stripped if _URL_RE.match(s)]
             
             logger.info(f"Read {len(urls)} URLs from 'URLs.txt'")
             return urls
@@ -143,6 +179,39 @@ class FileHandler:
         
         return True
     
+    def _probe_writable(self, directory: str) -> bool:
+        """
+        Confirms a file can actually be created in directory.
+        
+        Uses an unnamed O_TMPFILE file where supported (Linux), so nothing
+        ever appears in the directory. Otherwise creates and deletes a
+        test file.
+        
+        Args:
+            directory (str): Directory path
+            
+        Returns:
+            bool: True if a file could be created
+        """
+        if hasattr(os, 'O_TMPFILE'):
+            try:
+                os.close(os.open(directory, os.O_TMPFILE | os.O_WRONLY, 0o600))
+                return True
+            except PermissionError:
+                return False
+            except OSError:
+                # Filesystem without O_TMPFILE support, use the test file
+                pass
+        
+        test_file = os.path.join(directory, '.test_write')
+        try:
+            with open(test_file, 'w') as f:
+                f.write('test')
+            os.remove(test_file)
+            return True
+        except Exception:
+            return False
+    
     def ensure_download_directory(self, directory: str) -> bool:
         """
         Ensures download directory exists and is writable.
@@ -158,12 +227,7 @@ class FileHandler:
             os.makedirs(directory, exist_ok=True)
             
             # Test write permissions
-            test_file = os.path.join(directory, '.test_write')
-            try:
-                with open(test_file, 'w') as f:
-                    f.write('test')
-                os.remove(test_file)
-            except Exception:
+            if not os.access(directory, os.W_OK) or not self._probe_writable(directory):
                 error("Directory not writable")
                 return False
             
@@ -1,13 +1,15 @@
 # Main menu interface for QUIK Downloader
-import os
 import logging
-from typing import List
+from typing import TYPE_CHECKING, List, Tuple
 from quik_downloader.core.file_handler import FileHandler
-from quik_downloader.core.downloader import VideoDownloader
 from quik_downloader.ui.settings_manager import SettingsManager
-from quik_downloader.utils.file_editor import file_editor
 from quik_downloader.utils.colors import *
 
+# The downloader (and asyncio with it) and the file editor are imported
+# by the handlers that use them, keeping startup down to the menu itself
+if TYPE_CHECKING:
+    from quik_downloader.core.downloader import VideoDownloader
+
 # Get logger for this module
 logger = logging.getLogger('QUIK_Downloader.menu')
 
@@ -22,7 +24,7 @@ class MenuInterface:
     
     def _clear_screen(self):
         """Clear terminal screen (cross-platform)."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        clear_screen()
     
     def show_header(self, title: str = ""):
         """Displays the application header."""
@@ -80,10 +82,13 @@ class MenuInterface:
     
     def download_videos(self):
         """Handle video downloading process."""
+        import asyncio
+        from quik_downloader.core.downloader import VideoDownloader
+        
         self.show_header("VIDEO DOWNLOAD")
         
         # Refresh settings and get ffmpeg_path
-        self.settings_manager.settings = self.file_handler.read_settings()
+        self.settings_manager.reload()
         ffmpeg_path = self.settings_manager.settings.get('ffmpeg_path', 'ffmpeg')
         logger.info(f"Using FFMPEG path: {ffmpeg_path}")
 
@@ -117,7 +122,8 @@ class MenuInterface:
         # Show current settings
         quality = self.settings_manager.settings['video_quality']
         format_type = self.settings_manager.settings['output_format']
-        print_neutral(f"Quality: {quality} | Format: {format_type}")
+        max_concurrency = self._get_max_concurrency()
+        print_neutral(f"Quality: {quality} | Format: {format_type} | Parallel: {max_concurrency}")
         
         # Confirm download
         print()
@@ -138,21 +144,8 @@ class MenuInterface:
         print()
         print_separator()
         
-        successful = 0
-        failed = 0
-        
-        for i, url in enumerate(urls, 1):
-            print(f"\n{colored_text(f'Video {i}/{len(urls)}', 'info')}")
-            
-            try:
-                if downloader.download_video(url, download_dir):
-                    successful += 1
-                else:
-                    failed += 1
-            except Exception as e:
-                error(f"Error: {str(e)[:30]}")
-                failed += 1
-                logger.error(f"Download exception for {url}: {e}")
+        successful, failed = asyncio.run(
+            self._run_downloads(downloader, urls, download_dir, max_concurrency))
         
         # Summary
         print()
@@ -170,8 +163,66 @@ class MenuInterface:
         
         input("\nPress Enter to continue...")
     
+    def _get_max_concurrency(self) -> int:
+        """Returns the configured number of parallel downloads (at least 1)."""
+        value = self.settings_manager.settings.get('max_concurrent_downloads', '3')
+        try:
+            return max(1, int(value))
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid max_concurrent_downloads value: {value!r}, using 3")
+            return 3
+    
+    async def _run_downloads(self, downloader: 'VideoDownloader', urls: List[str],
+                             download_dir: str, max_concurrency: int) -> Tuple[int, int]:
+        """Downloads all URLs concurrently, at most max_concurrency at a time.
+        
+        A producer probes each URL's streams and queues it while the
+        download workers are busy with earlier URLs, so probing overlaps
+        downloading. The bounded queue keeps probing a few URLs ahead.
+        """
+        import asyncio
+        from quik_downloader.ui.output_framer import print_header, print_footer, print_status
+        
+        queue: 'asyncio.Queue' = asyncio.Queue(maxsize=2 * max_concurrency)
+        results: List[bool] = []
+        
+        async def _produce():
+            for i, url in enumerate(urls, 1):
+                # Fills the downloader's cache, download_video reuses it
+                await downloader.probe_streams(url)
+                await queue.put((i, url))
+            for _ in range(max_concurrency):
+                await queue.put(None)
+        
+        async def _consume():
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                i, url = item
+                label = f"[{i}/{len(urls)}]"
+                try:
+                    results.append(await downloader.download_video(url, download_dir, label))
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    print_status('error', f"{label} Error: {str(e)[:30]}")
+                    logger.error(f"Download exception for {url}: {e}")
+                    results.append(False)
+        
+        # The whole batch shares one frame; downloads report inside it
+        print_header(f"{len(urls)} video(s), {max_concurrency} at a time")
+        try:
+            await asyncio.gather(_produce(), *(_consume() for _ in range(max_concurrency)))
+        finally:
+            print_footer()
+        successful = sum(1 for result in results if result)
+        return successful, len(results) - successful
+    
     def edit_urls_file(self):
         """Open URLs.txt file for editing."""
+        from quik_downloader.utils.file_editor import file_editor
+        
         self.show_header("EDIT URLs.txt")
         
         print_info("Opening URLs.txt for editing...")
@@ -1,69 +1,204 @@
 import shutil
-from quik_downloader.utils.colors import print_progress, get_color
+import signal
+import sys
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from quik_downloader.utils.colors import (print_progress, get_color, print_success,
+                                          print_error, print_warning, print_info)
+
+# Box decorations are built once instead of on every framed line
+_BOX = get_color('cyan')
+_RST = get_color('reset')
+_LEFT = f"{_BOX}│{_RST}"
+_RIGHT = f"{_RST}{_BOX}│{_RST}"
+
+# Every framed line goes out as one write under this lock, so concurrent
+# downloads can't interleave characters within a line
+_io_lock = threading.Lock()
+
+# Latest progress of every running download, keyed by its title, as a
+# (full line, short summary) pair. Concurrent downloads share a single
+# progress row instead of racing each other for the cursor; with more
+# than one running, each only gets its short summary on that row.
+_active_progress: Dict[str, Tuple[str, str]] = {}
+
+# Whether a box is currently open, and under which title. A batch of
+# downloads shares one box, so a download only draws its own header and
+# footer when none is open.
+_frame_open = False
+_frame_title: Optional[str] = None
+
+# Whether the progress row is the last thing on screen (ended by '\r')
+_progress_shown = False
+
+# Symbol, color and unframed printer of each status message kind
+_STATUS_STYLES = {
+    'success': ('✓', 'green', print_success),
+    'error': ('✗', 'red', print_error),
+    'warning': ('⚠', 'yellow', print_warning),
+    'info': ('ℹ', 'cyan', print_info),
+    'progress': ('→', 'dim', print_progress),
+}
+
+# Progress redraws are throttled to ~10 Hz; the newest skipped line is
+# kept so that flush_progress() can still show the final state.
+_PROGRESS_INTERVAL = 0.1
+_last_progress_ts = 0.0
+_pending_progress: Optional[str] = None
+
+# Terminal width is cached so that redrawing a line does not cost an
+# ioctl. It is refreshed on SIGWINCH where available, otherwise every
+# _WIDTH_REFRESH_INTERVAL lookups.
+_cached_width: Optional[int] = None
+_width_lookups = 0
+_WIDTH_REFRESH_INTERVAL = 64
+
+def _refresh_width(*_args) -> int:
+    """Re-reads the terminal width into the cache."""
+    global _cached_width
+    _cached_width = shutil.get_terminal_size((80, 20)).columns
+    return _cached_width
+
+_HAS_SIGWINCH = False
+if hasattr(signal, 'SIGWINCH'):
+    try:
+        if signal.getsignal(signal.SIGWINCH) in (signal.SIG_DFL, None):
+            signal.signal(signal.SIGWINCH, _refresh_width)
+            _HAS_SIGWINCH = True
+    except (ValueError, OSError):
+        # Not in the main thread, keep polling instead
+        pass
 
 def get_terminal_width():
-    """Gets the width of the terminal."""
-    return shutil.get_terminal_size((80, 20)).columns
+    """Gets the (cached) width of the terminal."""
+    global _width_lookups
+    if _cached_width is None:
+        return _refresh_width()
+    if not _HAS_SIGWINCH:
+        _width_lookups += 1
+        if _width_lookups >= _WIDTH_REFRESH_INTERVAL:
+            _width_lookups = 0
+            return _refresh_width()
+    return _cached_width
+
+def _write(text: str, flush: bool = False, progress: bool = False):
+    """Writes pre-composed output in a single call, flushing only when asked."""
+    global _progress_shown
+    with _io_lock:
+        _progress_shown = progress
+        sys.stdout.write(text)
+        if flush:
+            sys.stdout.flush()
+
+@lru_cache(maxsize=8)
+def _borders(width: int) -> Tuple[str, str, str]:
+    """Returns the top, separator and bottom border lines for a terminal width."""
+    rule = '─' * (width - 2)
+    return (f"{_BOX}┌{rule}┐{_RST}", f"{_BOX}├{rule}┤{_RST}", f"{_BOX}└{rule}┘{_RST}")
+
+def _frame_line(line: str, width: int, color: str = '') -> str:
+    """Fits a line into the box, truncating it if it's too long."""
+    max_line_width = width - 4
+    fitted = f"{line.strip()[:max_line_width]:<{max_line_width}}"
+    if color:
+        # Colored after padding, so escape codes don't count as width
+        fitted = f"{color}{fitted}{_RST}"
+    return f"{_LEFT} {fitted} {_RIGHT}"
 
 def print_header(title: str):
     """Prints a styled header box for FFMPEG output."""
-    width = get_terminal_width()
-    
-    # Use cyan for the box
-    box_color = get_color('cyan')
-    reset_color = get_color('reset')
+    global _frame_open, _frame_title
+    _frame_open = True
+    _frame_title = title
+    width = _refresh_width()
+    top, separator, _ = _borders(width)
     
     title_text = f" FFMPEG Output: {title} "
     
-    print(box_color + '┌' + '─' * (width - 2) + '┐' + reset_color)
-    print(box_color + '│' + title_text.center(width - 2) + '│' + reset_color)
-    print(box_color + '├' + '─' * (width - 2) + '┤' + reset_color)
+    _write(f"{top}\n{_BOX}│{title_text.center(width - 2)}│{_RST}\n{separator}\n")
 
 def print_content_line(line: str):
     """Prints a line of content within the box, correctly formatted."""
-    width = get_terminal_width()
+    _write(_frame_line(line, get_terminal_width()) + '\n')
+
+def print_progress_line(line: str):
+    """Prints a progress line within the box, using carriage return to overwrite.
     
-    box_color = get_color('cyan')
-    reset_color = get_color('reset')
+    Updates arriving faster than _PROGRESS_INTERVAL are deferred until the
+    next update or flush_progress().
+    """
+    global _last_progress_ts, _pending_progress
+    now = time.monotonic()
+    if now - _last_progress_ts < _PROGRESS_INTERVAL:
+        _pending_progress = line
+        return
+    _last_progress_ts = now
+    _pending_progress = None
+    _write(_frame_line(line, get_terminal_width()) + '\r', flush=True, progress=True)
 
-    # Clean the line from ffmpeg
-    cleaned_line = line.strip()
+def flush_progress():
+    """Renders the last deferred progress line, if any."""
+    global _last_progress_ts, _pending_progress
+    if _pending_progress is not None:
+        _last_progress_ts = time.monotonic()
+        _write(_frame_line(_pending_progress, get_terminal_width()) + '\r', flush=True, progress=True)
+        _pending_progress = None
 
-    # Truncate line if it's too long
-    max_line_width = width - 4
-    if len(cleaned_line) > max_line_width:
-        cleaned_line = cleaned_line[:max_line_width]
+def render_progress_bar(fraction: float, width: int = 20) -> str:
+    """Renders a 0.0-1.0 fraction as a bar of Unicode blocks."""
+    filled = int(round(min(max(fraction, 0.0), 1.0) * width))
+    return '█' * filled + '░' * (width - filled)
+
+def update_progress(title: str, line: str, summary: str):
+    """Records the progress of one download and redraws the shared progress row.
     
-    # Format and print
-    formatted_line = f" {cleaned_line.ljust(width - 4)} "
-    print(box_color + '│' + reset_color + formatted_line + box_color + '│' + reset_color)
+    line is shown while the download runs alone, the short summary
+    (label and percentage) while it shares the row with others.
+    """
+    _active_progress[title] = (line.strip(), summary)
+    if len(_active_progress) == 1:
+        print_progress_line(line)
+    else:
+        print_progress_line(' | '.join(short for _, short in _active_progress.values()))
 
-def print_progress_line(line: str):
-    """Prints a progress line within the box, using carriage return to overwrite."""
-    width = get_terminal_width()
+def end_progress(title: str):
+    """Removes a finished download from the shared progress row.
     
-    box_color = get_color('cyan')
-    reset_color = get_color('reset')
+    When it was the last one running, its final progress is kept on screen.
+    """
+    if _active_progress.pop(title, None) is not None and not _active_progress:
+        flush_progress()
+        if _progress_shown:
+            _write('\n')
 
-    # Clean the line from ffmpeg
-    cleaned_line = line.strip()
+def open_frame(title: str) -> bool:
+    """Opens a box for title unless one is already open; True if it opened one."""
+    if _frame_open:
+        return False
+    print_header(title)
+    return True
 
-    # Truncate line if it's too long
-    max_line_width = width - 4
-    if len(cleaned_line) > max_line_width:
-        cleaned_line = cleaned_line[:max_line_width]
-    
-    # Format and print using carriage return
-    formatted_line = f" {cleaned_line.ljust(width - 4)} "
-    print(box_color + '│' + reset_color + formatted_line + box_color + '│' + reset_color, end='\r')
+def print_status(kind: str, message: str):
+    """Prints a success/error/warning/info/progress message, inside the box if one is open."""
+    symbol, color, printer = _STATUS_STYLES[kind]
+    if not _frame_open:
+        printer(message)
+        return
+    _write(_frame_line(f"{symbol} {message}", get_terminal_width(), get_color(color)) + '\n')
+
+def print_download_line(title: str, line: str):
+    """Prints a content line, tagged with its download unless it has the box to itself."""
+    if title != _frame_title:
+        line = f"{title} {line.strip()}"
+    print_content_line(line)
 
 def print_footer():
     """Prints the footer of the box."""
-    width = get_terminal_width()
-    box_color = get_color('cyan')
-    reset_color = get_color('reset')
-    
-    print(box_color + '└' + '─' * (width - 2) + '┘' + reset_color)
+    global _frame_open
+    _frame_open = False
+    _write(_borders(get_terminal_width())[2] + '\n', flush=True)
 
 def print_boxed_output(title: str, output_lines: list):
     """Prints a list of lines inside a styled box."""
@@ -1,66 +1,124 @@
 # Settings management for QUIK Downloader
-import os
+import sys
 import logging
-from typing import Dict, Any, List, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from quik_downloader.core.file_handler import FileHandler
 from quik_downloader.utils.colors import *
 
 # Get logger for this module
 logger = logging.getLogger('QUIK_Downloader.settings_manager')
 
+# Quality options with descriptions and technical info, built once per process
+_QUALITY_OPTIONS: Mapping[str, Mapping[str, Optional[str]]] = MappingProxyType({
+    'best': MappingProxyType({
+        'name': '[BEST] Original Quality',
+        'description': 'Direct stream copy (~30s)',
+        'technical': '-c copy',
+        'speed': 'FAST',
+        'warning': None
+    }),
+    'high': MappingProxyType({
+        'name': '[HIGH] 720p Quality',
+        'description': 'Re-encoding to 720p (~2-5min)',
+        'technical': '-vf scale=-2:720 -c:v libx264',
+        'speed': 'SLOW',
+        'warning': 'Requires re-encoding (much slower)'
+    }),
+    'medium': MappingProxyType({
+        'name': '[MEDIUM] 480p Quality',
+        'description': 'Re-encoding to 480p (~2-5min)',
+        'technical': '-vf scale=-2:480 -c:v libx264',
+        'speed': 'SLOW',
+        'warning': 'Requires re-encoding (much slower)'
+    }),
+    'low': MappingProxyType({
+        'name': '[LOW] 360p Quality',
+        'description': 'Re-encoding to 360p (~2-5min)',
+        'technical': '-vf scale=-2:360 -c:v libx264',
+        'speed': 'SLOW',
+        'warning': 'Requires re-encoding (much slower)'
+    })
+})
+
+@lru_cache(maxsize=1)
+def _render_quality_info() -> str:
+    """Render the quality options screen once; colors are settled by then."""
+    parts = [render_header("QUALITY OPTIONS")]
+    for info in _QUALITY_OPTIONS.values():
+        parts.append(f"\n{colored_text(info['name'], 'highlight')}")
+        parts.append(f"   {info['description']}")
+        parts.append(f"   Command: {colored_text(info['technical'], 'dim')}")
+        parts.append(f"   Speed: {colored_text(info['speed'], 'info')}")
+        if info['warning']:
+            parts.append(f"   {colored_text('⚠ ' + info['warning'], 'warning')}")
+    return "\n".join(parts) + "\n"
+
+# Output formats accepted by _edit_output_format, and how they are listed
+_VALID_FORMATS = frozenset({'mp4', 'mkv', 'avi', 'mov'})
+_FORMAT_CHOICES = 'mp4, mkv, avi, mov'
+
+# Answers accepted as confirmation
+_YES_ANSWERS = frozenset({'y', 'yes'})
+
 class SettingsManager:
     """Handles all settings-related operations."""
     
+    # Settings menu choices mapped to the methods handling them ('6' exits)
+    _MENU_ACTIONS = {
+        '1': '_edit_download_directory',
+        '2': '_edit_video_quality',
+        '3': '_edit_output_format',
+        '4': '_edit_ffmpeg_path',
+        '5': '_save_settings',
+    }
+    
     def __init__(self):
         """Initialize SettingsManager with FileHandler."""
         self.file_handler = FileHandler()
-        self.settings = self.file_handler.read_settings()
+        self.reload()
+        
+        # Static decorations of the settings screen, rendered once
+        self._sep = render_separator()
+        self._settings_header = render_header("SETTINGS")
+        self._current_label = f"\n{colored_text('Current Settings:', 'info')}"
+        self._menu_footer = (f"\n  5. {colored_text('Save Settings', 'success')}\n"
+                             f"  6. {colored_text('Back to Main Menu', 'neutral')}")
+        self._menu_prompt = f"\n{colored_text('Select option (1-6):', 'neutral')} "
+        self._format_prompt = f"Options: {colored_text(_FORMAT_CHOICES, 'dim')}"
         logger.info("SettingsManager initialized")
     
-    def _clear_screen(self):
-        """Clears the terminal screen - Cross Platform."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+    def reload(self):
+        """Load settings from disk, discarding unsaved edits."""
+        self.settings = self.file_handler.read_settings()
+        
+        # Snapshot of the saved state; _dirty is set by any real edit
+        self._original = dict(self.settings)
+        self._dirty = False
+    
+    def _set_setting(self, key: str, value: str):
+        """Update a setting, marking the settings dirty only on a real change."""
+        if self.settings.get(key) != value:
+            self.settings[key] = value
+            self._dirty = True
     
-    def _get_quality_options(self) -> Dict[str, Dict[str, str]]:
+    @staticmethod
+    def _prompt(msg: str) -> str:
+        """Read a menu answer, stripped and lowercased in a single pass."""
+        answer = input(msg).strip()
+        return answer.lower() if answer else answer
+    
+    def _get_quality_options(self) -> Mapping[str, Mapping[str, Optional[str]]]:
         """Returns detailed quality options with descriptions and technical info."""
-        return {
-            'best': {
-                'name': '[BEST] Original Quality',
-                'description': 'Direct stream copy (~30s)',
-                'technical': '-c copy',
-                'speed': 'FAST',
-                'warning': None
-            },
-            'high': {
-                'name': '[HIGH] 720p Quality', 
-                'description': 'Re-encoding to 720p (~2-5min)',
-                'technical': '-vf scale=-2:720 -c:v libx264',
-                'speed': 'SLOW',
-                'warning': 'Requires re-encoding (much slower)'
-            },
-            'medium': {
-                'name': '[MEDIUM] 480p Quality',
-                'description': 'Re-encoding to 480p (~2-5min)', 
-                'technical': '-vf scale=-2:480 -c:v libx264',
-                'speed': 'SLOW',
-                'warning': 'Requires re-encoding (much slower)'
-            },
-            'low': {
-                'name': '[LOW] 360p Quality',
-                'description': 'Re-encoding to 360p (~2-5min)',
-                'technical': '-vf scale=-2:360 -c:v libx264', 
-                'speed': 'SLOW',
-                'warning': 'Requires re-encoding (much slower)'
-            }
-        }
+        return _QUALITY_OPTIONS
     
     def _validate_quality_input(self, quality: str) -> Tuple[bool, str]:
-        """Validates quality input and returns validation result."""
+        """Validates normalized quality input (see _prompt) and returns validation result."""
         if not quality:
             return True, "No change"
             
-        quality = quality.lower().strip()
-        valid_options = self._get_quality_options().keys()
+        valid_options = _QUALITY_OPTIONS.keys()
         
         if quality in valid_options:
             return True, quality
@@ -69,16 +127,8 @@ class SettingsManager:
     
     def _show_quality_detailed_info(self):
         """Shows detailed information about all quality options."""
-        print_header("QUALITY OPTIONS")
-        
-        options = self._get_quality_options()
-        for key, info in options.items():
-            print(f"\n{colored_text(info['name'], 'highlight')}")
-            print(f"   {info['description']}")
-            print(f"   Command: {colored_text(info['technical'], 'dim')}")
-            print(f"   Speed: {colored_text(info['speed'], 'info')}")
-            if info['warning']:
-                print(f"   {colored_text('⚠ ' + info['warning'], 'warning')}")
+        sys.stdout.write(_render_quality_info())
+        sys.stdout.flush()
     
     def _show_quality_warning(self, quality: str):
         """Shows warning for qualities that require re-encoding."""
@@ -87,27 +137,19 @@ class SettingsManager:
             warning(options[quality]['warning'])
             info("TIP: Use 'best' for fast downloads")
             
-            confirm = input(f"\n{colored_text('Continue? (y/N):', 'neutral')} ").strip().lower()
-            return confirm in ['y', 'yes']
+            confirm = self._prompt(f"\n{colored_text('Continue? (y/N):', 'neutral')} ")
+            return confirm in _YES_ANSWERS
         return True
     
     def show_settings_menu(self):
         """Display and handle the settings menu."""
         while True:
-            self._clear_screen()
-            self._display_settings()
-            choice = input(f"\n{colored_text('Select option (1-6):', 'neutral')} ").strip()
+            repaint_screen(self._render_settings())
+            choice = self._prompt(self._menu_prompt)
             
-            if choice == '1':
-                self._edit_download_directory()
-            elif choice == '2':
-                self._edit_video_quality()
-            elif choice == '3':
-                self._edit_output_format()
-            elif choice == '4':
-                self._edit_ffmpeg_path()
-            elif choice == '5':
-                self._save_settings()
+            handler = self._MENU_ACTIONS.get(choice)
+            if handler:
+                getattr(self, handler)()
             elif choice == '6':
                 logger.info("Exiting settings menu")
                 break
@@ -115,23 +157,21 @@ class SettingsManager:
                 error("Invalid choice! Select 1-6")
                 input("\nPress Enter to continue...")
     
-    def _display_settings(self):
-        """Display current settings."""
-        print_header("SETTINGS")
-        
-        print(f"\n{colored_text('Current Settings:', 'info')}")
-        print(f"  1. Download Directory: {colored_text(self.settings['download_directory'], 'neutral')}")
-        print(f"  2. Video Quality: {colored_text(self.settings['video_quality'], 'highlight')}")
-        print(f"  3. Output Format: {colored_text(self.settings['output_format'], 'neutral')}")
-        
+    def _render_settings(self) -> str:
+        """Build the current settings screen."""
         ffmpeg_path = self.settings.get('ffmpeg_path') or 'ffmpeg'
         display_path = ffmpeg_path if ffmpeg_path != 'ffmpeg' else 'Auto (in PATH)'
-        print(f"  4. FFMPEG Path: {colored_text(display_path, 'dim')}")
         
-        print(f"\n  5. {colored_text('Save Settings', 'success')}")
-        print(f"  6. {colored_text('Back to Main Menu', 'neutral')}")
-        
-        print_separator()
+        return "\n".join([
+            self._settings_header,
+            self._current_label,
+            f"  1. Download Directory: {colored_text(self.settings['download_directory'], 'neutral')}",
+            f"  2. Video Quality: {colored_text(self.settings['video_quality'], 'highlight')}",
+            f"  3. Output Format: {colored_text(self.settings['output_format'], 'neutral')}",
+            f"  4. FFMPEG Path: {colored_text(display_path, 'dim')}",
+            self._menu_footer,
+            self._sep,
+        ])
     
     def _edit_download_directory(self):
         """Modifies the download directory."""
@@ -140,7 +180,7 @@ class SettingsManager:
         
         if new_dir:
             if self.file_handler.ensure_download_directory(new_dir):
-                self.settings['download_directory'] = new_dir
+                self._set_setting('download_directory', new_dir)
                 success(f"Updated to: {new_dir}")
                 warning("Remember: Save settings to persist!")
             else:
@@ -155,9 +195,9 @@ class SettingsManager:
         self._show_quality_detailed_info()
         
         print(f"\n{colored_text('Type', 'dim')} {colored_text('info', 'info')} {colored_text('to see options again', 'dim')}")
-        new_quality = input("New quality (Enter = keep current): ").strip()
+        new_quality = self._prompt("New quality (Enter = keep current): ")
         
-        if new_quality.lower() == 'info':
+        if new_quality == 'info':
             input("\nPress Enter to continue...")
             return
         
@@ -177,7 +217,7 @@ class SettingsManager:
             input("Press Enter to continue...")
             return
         
-        self.settings['video_quality'] = result
+        self._set_setting('video_quality', result)
         success(f"Quality updated to: {result}")
         warning("Remember: Save settings to persist!")
         
@@ -186,11 +226,11 @@ class SettingsManager:
     def _edit_output_format(self):
         """Modifies the output format."""
         print(f"\nCurrent: {colored_text(self.settings['output_format'], 'highlight')}")
-        print(f"Options: {colored_text('mp4, mkv, avi, mov', 'dim')}")
-        new_format = input("New format (Enter = keep current): ").strip().lower()
+        print(self._format_prompt)
+        new_format = self._prompt("New format (Enter = keep current): ")
         
-        if new_format and new_format in ['mp4', 'mkv', 'avi', 'mov']:
-            self.settings['output_format'] = new_format
+        if new_format in _VALID_FORMATS:
+            self._set_setting('output_format', new_format)
             success(f"Format updated to: {new_format}")
             warning("Remember: Save settings to persist!")
         elif new_format:
@@ -207,7 +247,7 @@ class SettingsManager:
         new_path = input("Enter full path to FFMPEG executable: ").strip()
         
         # If user enters nothing, we set it to the default 'ffmpeg'
-        self.settings['ffmpeg_path'] = new_path or 'ffmpeg'
+        self._set_setting('ffmpeg_path', new_path or 'ffmpeg')
         
         if self.settings['ffmpeg_path'] == 'ffmpeg':
             success("FFMPEG path set to auto-detection (from PATH)")
@@ -218,11 +258,19 @@ class SettingsManager:
         input("\nPress Enter to continue...")
     
     def _save_settings(self):
-        """Save current settings to file."""
+        """Save current settings to file, skipping the write if nothing changed."""
+        if not self._dirty or self.settings == self._original:
+            self._dirty = False
+            info("No changes to save")
+            input("Press Enter to continue...")
+            return
+        
         print_progress("Saving settings...")
         
         try:
             if self.file_handler.write_settings(self.settings):
+                self._original = dict(self.settings)
+                self._dirty = False
                 logger.info("Settings saved successfully")
                 success("Settings saved successfully!")
             else:
@@ -6,86 +6,164 @@ Cross-platform color support with robust fallbacks.
 import os
 import sys
 import platform
+from functools import lru_cache
 
-# Global variable to track color support
+# Global variable to track color support (settled on first color use)
 COLOR_ENABLED = False
 
+# Whether the terminal understands ANSI escape sequences (cursor, clear)
+VT_ENABLED = os.name != 'nt'
+
+# Color codes; None until _ensure_colors() runs on first use, so importing
+# this module never touches the Windows console
+Fore = None
+Style = None
+_COLOR_MAP = {}
+_NAMED_COLORS = {}
+
+# Environment facts reported by get_color_status; fixed for the process lifetime
+_STATUS = {
+    'platform': platform.system(),
+    'python_version': sys.version_info[:2],
+    'terminal': os.environ.get('TERM', 'unknown')
+}
+
+
+class _AnsiColors:
+    RED = "\x1b[31m"
+    GREEN = "\x1b[32m"
+    YELLOW = "\x1b[33m"
+    BLUE = "\x1b[34m"
+    MAGENTA = "\x1b[35m"
+    CYAN = "\x1b[36m"
+    WHITE = "\x1b[37m"
+
+
+class _AnsiStyle:
+    BRIGHT = "\x1b[1m"
+    DIM = "\x1b[2m"
+    RESET_ALL = "\x1b[0m"
+
+
+class _DummyColors:
+    RED = GREEN = YELLOW = CYAN = WHITE = MAGENTA = BLUE = ""
+
+
+class _DummyStyle:
+    BRIGHT = DIM = RESET_ALL = ""
+
+
+def _enable_virtual_terminal() -> bool:
+    """Enable ANSI escape processing on the Windows console, once per process."""
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        # Enable virtual terminal processing
+        handle = kernel32.GetStdHandle(-11)
+        return bool(kernel32.SetConsoleMode(handle, 7))
+    except Exception:
+        return False
+
 
 def _init_colors():
     """Initialize color support based on platform and capabilities."""
-    global COLOR_ENABLED
+    global COLOR_ENABLED, VT_ENABLED
     
-    # Try colorama first (best cross-platform solution)
-    try:
-        from colorama import init, Fore, Style
-        init(autoreset=True, convert=True, strip=False)
-        
-        # Enable ANSI support on Windows
-        if os.name == 'nt':
-            try:
-                import ctypes
-                kernel32 = ctypes.windll.kernel32
-                # Enable virtual terminal processing
-                handle = kernel32.GetStdHandle(-11)
-                kernel32.SetConsoleMode(handle, 7)
-            except:
-                pass
-        
-        COLOR_ENABLED = True
-        return Fore, Style
-        
-    except ImportError:
-        # Fallback: No colors
-        class DummyColors:
-            RED = GREEN = YELLOW = CYAN = WHITE = MAGENTA = BLUE = ""
-        class DummyStyle:
-            BRIGHT = DIM = RESET_ALL = ""
-            
+    # Piped or redirected output gets plain text
+    isatty = getattr(sys.stdout, 'isatty', None)
+    if not (isatty and isatty()):
         COLOR_ENABLED = False
-        return DummyColors(), DummyStyle()
+        return _DummyColors(), _DummyStyle()
+    
+    # Enable ANSI support on Windows (10+); legacy consoles refuse it
+    if os.name == 'nt':
+        VT_ENABLED = _enable_virtual_terminal()
+    
+    # ANSI escapes are written straight to the terminal
+    COLOR_ENABLED = VT_ENABLED
+    if COLOR_ENABLED:
+        return _AnsiColors(), _AnsiStyle()
+    
+    # Fallback: No colors
+    return _DummyColors(), _DummyStyle()
 
 
-# Initialize colors
-Fore, Style = _init_colors()
+def _ensure_colors():
+    """Initialize colors and the color lookups, once, on first use."""
+    global Fore, Style, _COLOR_MAP, _NAMED_COLORS
+    if Fore is not None:
+        return
+    
+    Fore, Style = _init_colors()
+    
+    # Color lookups, built once. Both stay empty when colors are disabled,
+    # in which case every lookup falls back to plain text.
+    if not COLOR_ENABLED:
+        return
+    _COLOR_MAP = {
+        'success': Fore.GREEN + Style.BRIGHT,
+        'error': Fore.RED + Style.BRIGHT,
+        'warning': Fore.YELLOW + Style.BRIGHT,
+        'info': Fore.CYAN + Style.BRIGHT,
+        'highlight': Fore.MAGENTA + Style.BRIGHT,
+        'neutral': Fore.WHITE,
+        'dim': Style.DIM
+    }
+    _NAMED_COLORS = {
+        'red': Fore.RED,
+        'green': Fore.GREEN,
+        'yellow': Fore.YELLOW,
+        'cyan': Fore.CYAN,
+        'white': Fore.WHITE,
+        'magenta': Fore.MAGENTA,
+        'blue': Fore.BLUE,
+        'reset': Style.RESET_ALL,
+        'bright': Style.BRIGHT,
+        'dim': Style.DIM
+    }
 
 
 def _colorize(text: str, color_code: str) -> str:
     """Apply color to text if colors are enabled."""
+    if Fore is None:
+        _ensure_colors()
     if COLOR_ENABLED:
         return f"{color_code}{text}{Style.RESET_ALL}"
     return text
 
 
-def _print_colored(symbol: str, message: str, color_code: str):
+def _print_colored(symbol: str, message: str, color_name: str):
     """Print colored message with symbol."""
-    colored_symbol = _colorize(symbol, color_code + Style.BRIGHT)
+    if Fore is None:
+        _ensure_colors()
+    colored_symbol = _colorize(symbol, _NAMED_COLORS.get(color_name, "") + Style.BRIGHT)
     print(f"{colored_symbol} {message}")
 
 
 # Core color functions
 def print_success(message: str):
     """Print success message in green."""
-    _print_colored("✓", message, Fore.GREEN)
+    _print_colored("✓", message, 'green')
 
 
 def print_error(message: str):
     """Print error message in red."""
-    _print_colored("✗", message, Fore.RED)
+    _print_colored("✗", message, 'red')
 
 
 def print_warning(message: str):
     """Print warning message in yellow."""
-    _print_colored("⚠", message, Fore.YELLOW)
+    _print_colored("⚠", message, 'yellow')
 
 
 def print_info(message: str):
     """Print info message in cyan."""
-    _print_colored("ℹ", message, Fore.CYAN)
+    _print_colored("ℹ", message, 'cyan')
 
 
 def print_highlight(message: str):
     """Print highlighted message in magenta."""
-    _print_colored("★", message, Fore.MAGENTA)
+    _print_colored("★", message, 'magenta')
 
 
 def print_neutral(message: str):
@@ -95,50 +173,55 @@ def print_neutral(message: str):
 
 def print_progress(message: str):
     """Print progress message in dim style."""
-    if COLOR_ENABLED:
-        colored_text = _colorize(f"→ {message}", Style.DIM)
-        print(colored_text)
-    else:
-        print(f"→ {message}")
+    if Fore is None:
+        _ensure_colors()
+    print(_colorize(f"→ {message}", Style.DIM))
+
+
+@lru_cache(maxsize=256)
+def _colorize_cached(text: str, color_code: str) -> str:
+    """Assemble a colored string once per (text, color) pair.
+
+    Static labels hit the cache on every redraw; dynamic values simply age
+    out of the bounded LRU.
+    """
+    return f"{color_code}{text}{Style.RESET_ALL}"
 
 
 def colored_text(text: str, color_type: str) -> str:
     """Return colored text string without printing."""
+    if Fore is None:
+        _ensure_colors()
     if not COLOR_ENABLED:
         return text
-    
-    color_map = {
-        'success': Fore.GREEN + Style.BRIGHT,
-        'error': Fore.RED + Style.BRIGHT,
-        'warning': Fore.YELLOW + Style.BRIGHT,
-        'info': Fore.CYAN + Style.BRIGHT,
-        'highlight': Fore.MAGENTA + Style.BRIGHT,
-        'neutral': Fore.WHITE,
-        'dim': Style.DIM
-    }
-    
-    color_code = color_map.get(color_type, Fore.WHITE)
-    return _colorize(text, color_code)
+    return _colorize_cached(text, _COLOR_MAP.get(color_type, Fore.WHITE))
+
+
+@lru_cache(maxsize=8)
+def render_separator(char: str = "=", length: int = 50) -> str:
+    """Return a (dimmed) separator line, built once per char/length."""
+    if Fore is None:
+        _ensure_colors()
+    return _colorize(char * length, Style.DIM)
+
+
+@lru_cache(maxsize=32)
+def render_header(title: str) -> str:
+    """Return a formatted header block, built once per title."""
+    if Fore is None:
+        _ensure_colors()
+    separator = render_separator()
+    return f"{separator}\n{_colorize(title.center(50), Fore.MAGENTA + Style.BRIGHT)}\n{separator}"
 
 
 def print_separator(char: str = "=", length: int = 50):
     """Print a separator line."""
-    line = char * length
-    if COLOR_ENABLED:
-        print(_colorize(line, Style.DIM))
-    else:
-        print(line)
+    sys.stdout.write(render_separator(char, length) + "\n")
 
 
 def print_header(title: str):
-    """Print a formatted header."""
-    print_separator()
-    if COLOR_ENABLED:
-        centered_title = title.center(50)
-        print(_colorize(centered_title, Fore.MAGENTA + Style.BRIGHT))
-    else:
-        print(title.center(50))
-    print_separator()
+    """Print a formatted header in a single write."""
+    sys.stdout.write(render_header(title) + "\n")
 
 
 # Shortcuts for common patterns
@@ -165,32 +248,48 @@ def highlight(msg: str):
 
 def get_color(color_name: str) -> str:
     """Returns the ANSI code for a given color name."""
-    if not COLOR_ENABLED:
-        return ""
-    
-    color_map = {
-        'red': Fore.RED,
-        'green': Fore.GREEN,
-        'yellow': Fore.YELLOW,
-        'cyan': Fore.CYAN,
-        'white': Fore.WHITE,
-        'magenta': Fore.MAGENTA,
-        'blue': Fore.BLUE,
-        'reset': Style.RESET_ALL,
-        'bright': Style.BRIGHT,
-        'dim': Style.DIM
-    }
-    return color_map.get(color_name.lower(), "")
+    if Fore is None:
+        _ensure_colors()
+    return _NAMED_COLORS.get(color_name.lower(), "")
+
+
+def clear_screen():
+    """Clear the terminal screen, with an ANSI escape where supported."""
+    if not sys.stdout.isatty():
+        # Nothing to clear when output is piped or redirected
+        return
+    if Fore is None:
+        _ensure_colors()
+    if VT_ENABLED:
+        sys.stdout.write('\x1b[2J\x1b[H')
+        sys.stdout.flush()
+    else:
+        # Legacy Windows console without ANSI support
+        os.system('cls')
+
+
+def repaint_screen(text: str):
+    """Redraw text over the previous screen in place instead of clearing it.
+
+    The cursor goes home, every line erases its own leftover cells and
+    whatever remains below the new content is erased, so only changed
+    cells actually flicker.
+    """
+    if Fore is None:
+        _ensure_colors()
+    if VT_ENABLED and sys.stdout.isatty():
+        sys.stdout.write('\x1b[H' + text.replace('\n', '\x1b[K\n') + '\x1b[K\n\x1b[J')
+    else:
+        clear_screen()
+        sys.stdout.write(text + '\n')
+    sys.stdout.flush()
 
 
 def get_color_status():
     """Return current color support status."""
-    return {
-        'enabled': COLOR_ENABLED,
-        'platform': platform.system(),
-        'python_version': sys.version_info[:2],
-        'terminal': os.environ.get('TERM', 'unknown')
-    }
+    if Fore is None:
+        _ensure_colors()
+    return {'enabled': COLOR_ENABLED, **_STATUS}
 
 
 def test_colors():
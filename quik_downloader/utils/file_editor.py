@@ -1,14 +1,77 @@
 # Cross-platform file editing utilities
 import os
+import shutil
 import subprocess
 import platform
 import logging
-import sys
+from functools import lru_cache
 from quik_downloader.utils.colors import *
 
 # Get logger for this module
 logger = logging.getLogger('QUIK_Downloader.file_editor')
 
+# Template written into a freshly created URLs.txt
+_URLS_TEMPLATE = (b"# File for video URLs to download\n"
+                  b"# One URL per line\n"
+                  b"# Example:\n"
+                  b"# https://example.com/video1.m3u8\n"
+                  b"# https://example.com/video2.mp4\n"
+                  b"\n")
+
+# Terminal/desktop editors tried on Linux, in order of preference
+_LINUX_EDITORS = ('nano', 'vim', 'vi', 'gedit', 'kate')
+
+
+@lru_cache(maxsize=None)
+def _find_linux_editor():
+    """Return the full path of the first available Linux editor, resolved once."""
+    for editor in _LINUX_EDITORS:
+        path = shutil.which(editor)
+        if path:
+            return path
+    return None
+
+
+# Editor command per OS; anything else (Linux and other Unix-likes) uses the
+# first editor found in PATH, falling back to xdg-open
+_EDITORS_BY_OS = {
+    'Windows': ('notepad',),
+    'Darwin': ('open', '-t'),
+}
+_EDITOR_COMMAND = _EDITORS_BY_OS.get(platform.system())
+
+
+def _launch_editor(path: str) -> bool:
+    """Open path in the platform's text editor, launched exactly once.
+    
+    Returns True when the editor exited cleanly.
+    """
+    command = _EDITOR_COMMAND
+    if command is None:
+        editor = _find_linux_editor()
+        if editor:
+            command = (editor,)
+        else:
+            warning("No suitable editor found")
+            print_info("Trying system default...")
+            command = ('xdg-open',)
+    
+    try:
+        returncode = subprocess.run([*command, path]).returncode
+    except OSError as e:
+        error(f"Cannot open editor: {e}")
+        logger.error(f"Could not launch {command[0]} for {path}: {e}")
+        return False
+    
+    if returncode != 0:
+        error(f"Editor failed with exit status {returncode}")
+        logger.error(f"Editor {command[0]} exited with {returncode} for {path}")
+        return False
+    
+    logger.info(f"File editor opened for: {path}")
+    return True
+
+
 class FileEditor:
     """Cross-platform file editor for URLs.txt file."""
     
@@ -23,10 +86,8 @@ class FileEditor:
         
         # Check if file exists, create if not
         if not os.path.exists(self.urls_file):
-            if self._create_urls_file():
-                logger.info("Created new URLs.txt file for editing")
-            else:
-                logger.error("Failed to create URLs.txt file")
+            if not self._handle_file_not_found():
+                logger.error("URLs.txt file not available for editing")
                 return
         
         # Open file with OS-appropriate editor
@@ -41,136 +102,41 @@ class FileEditor:
         except Exception as e:
             logger.error(f"Error during file editing: {e}")
     
-    def _create_urls_file(self) -> bool:
-        """Creates a new URLs.txt file with example content."""
-        try:
-            logger.info("Creating new URLs.txt file")
-            print("ERROR: URLs.txt file not found!")
-            print("Create a new URLs.txt file? (y/N): ", end="")
-            choice = input().strip().lower()
-            
-            if choice in ['y', 'yes']:
-                self._create_urls_file()
-            else:
-                print("Operation cancelled.")
-                return False
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error creating file: {e}")
-            print(f"ERROR: Error creating file: {e}")
-            return False
-    
     def _open_file_with_editor(self) -> bool:
         """Opens file with appropriate editor based on OS."""
-        try:
-            os_name = platform.system().lower()
-            
-            if os_name == 'windows':
-                return self._open_windows_editor()
-            elif os_name == 'darwin':  # macOS
-                return self._open_macos_editor()
-            else:  # Linux and others
-                return self._open_linux_editor()
-                
-        except Exception as e:
-            logger.error(f"Error opening file: {e}")
-            print(f"ERROR: Error opening file: {e}")
-            return False
-    
-    def _open_windows_editor(self) -> bool:
-        """Opens file with Windows Notepad."""
-        try:
-            subprocess.run(['notepad', self.urls_file], check=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            logger.warning("Failed to open with notepad on Windows")
-            return False
-    
-    def _open_macos_editor(self) -> bool:
-        """Opens file with macOS default text editor."""
-        try:
-            subprocess.run(['open', '-t', self.urls_file], check=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            logger.warning("Failed to open with default text editor on macOS")
-            return False
-    
-    def _open_linux_editor(self) -> bool:
-        """Opens file with Linux text editor (tries multiple options)."""
-        editors = ['nano', 'vim', 'vi', 'gedit']
-        
-        for editor in editors:
-            try:
-                subprocess.run([editor, self.urls_file], check=True)
-                return True
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                continue
-        
-        logger.warning("No suitable text editor found on Linux")
-        print("ERROR: No suitable text editor found!")
-        print("Please manually edit URLs.txt file")
-        return False 
+        return _launch_editor(self.urls_file)
 
-    def _create_urls_file(self):
+    def _create_urls_file(self) -> bool:
         """Create a new URLs.txt file with template content."""
-        template_content = """# File for video URLs to download
-# One URL per line
-# Example:
-# https://example.com/video1.m3u8
-# https://example.com/video2.mp4
-
-"""
-        
         try:
-            with open(self.urls_file, "w", encoding="utf-8") as f:
-                f.write(template_content)
+            fd = os.open(self.urls_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            try:
+                os.write(fd, _URLS_TEMPLATE)
+            finally:
+                os.close(fd)
             print("SUCCESS: Created new URLs.txt file.")
             logger.info("Created new URLs.txt file")
-            
-            # Try to open the new file for editing
-            self._open_with_system_editor(self.urls_file)
+            return True
+        except FileExistsError:
+            # Created since the existence check; keep its content
+            logger.info("URLs.txt appeared meanwhile, keeping it")
+            return True
         except Exception as e:
             print(f"ERROR: Error creating file: {e}")
             logger.error(f"Error creating URLs.txt file: {e}")
-
-    def _open_with_system_editor(self, file_path: str):
-        """Opens a file with the system's default text editor."""
-        try:
-            if os.name == 'nt':  # Windows
-                os.startfile(file_path)
-            elif sys.platform == 'darwin':  # macOS
-                subprocess.run(['open', '-t', file_path])
-            else:  # Linux and other Unix-like systems
-                # Try various text editors in order of preference
-                editors = ['nano', 'vim', 'vi', 'gedit']
-                for editor in editors:
-                    try:
-                        subprocess.run([editor, file_path], check=True)
-                        break
-                    except (subprocess.CalledProcessError, FileNotFoundError):
-                        continue
-                else:
-                    print(f"ERROR: Error opening file: {e}")
-                    logger.error(f"Error opening file with system editor: {e}")
-                
-            return True
-        except Exception as e:
-            print(f"ERROR: Error opening file: {e}")
-            logger.error(f"Error opening file with system editor: {e}")
             return False
 
-    def _handle_file_not_found(self):
+    def _handle_file_not_found(self) -> bool:
         """Handle case when URLs.txt doesn't exist."""
         print("ERROR: URLs.txt file not found!")
         print("Create a new URLs.txt file? (y/N): ", end="")
         choice = input().strip().lower()
         
         if choice in ['y', 'yes']:
-            self._create_urls_file()
-        else:
-            print("Operation cancelled.")
+            return self._create_urls_file()
+        
+        print("Operation cancelled.")
+        return False
 
 def file_editor(file_path: str):
     """
@@ -180,51 +146,15 @@ def file_editor(file_path: str):
     Args:
         file_path (str): Path to the file to edit
     """
-    if not os.path.exists(file_path):
-        try:
-            with open(file_path, 'w') as f:
-                f.write("")
-            logger.info(f"Created new file: {file_path}")
-        except Exception as e:
-            error(f"Cannot create file: {e}")
-            logger.error(f"Failed to create file {file_path}: {e}")
-            return
-    
+    # Create the file only if missing, in one syscall and without a race
     try:
-        system = platform.system()
-        
-        if system == "Windows":
-            # Windows - use notepad
-            subprocess.run(['notepad', file_path], check=True)
-        elif system == "Darwin":
-            # macOS - use TextEdit
-            subprocess.run(['open', '-e', file_path], check=True)
-        else:
-            # Linux/Unix - try common editors
-            editors = ['nano', 'vim', 'gedit', 'kate']
-            editor_found = False
-            
-            for editor in editors:
-                try:
-                    subprocess.run([editor, file_path], check=True)
-                    editor_found = True
-                    break
-                except (subprocess.CalledProcessError, FileNotFoundError):
-                    continue
-            
-            if not editor_found:
-                warning("No suitable editor found")
-                print_info("Trying system default...")
-                subprocess.run(['xdg-open', file_path], check=True)
-                
-        logger.info(f"File editor opened for: {file_path}")
-        
-    except subprocess.CalledProcessError as e:
-        error(f"Editor failed: {e}")
-        logger.error(f"Editor subprocess error for {file_path}: {e}")
-    except FileNotFoundError:
-        error("Editor not found")
-        logger.error(f"Editor not found for {file_path}")
+        os.close(os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644))
+        logger.info(f"Created new file: {file_path}")
+    except FileExistsError:
+        pass
     except Exception as e:
-        error(f"Cannot open editor: {e}")
-        logger.error(f"Unexpected error opening editor for {file_path}: {e}") 
\ No newline at end of file
+        error(f"Cannot create file: {e}")
+        logger.error(f"Failed to create file {file_path}: {e}")
+        return
+    
+    _launch_editor(file_path)